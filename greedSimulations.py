@@ -2,36 +2,23 @@
 
 import random
 
-import json
 import os
+from collections import defaultdict
+from multiprocessing import Pool
 
-# ----- helper functions -----
-
-
-def sumList(sum_list: list) -> int:
-    """
-
-    sums the values of a list.
-
-    Parameters:
-    -----------
-
-    sum_list: list
-        list of integers to find the sum of.
-
-    Returns:
-    --------
+import numba
+import numpy as np
+import orjson
 
-    sum: int
-        sum of the values in the list.
+# ----- helper functions -----
 
-    """
 
-    sum = 0
-    for value in sum_list:
-        sum += value
+# die rolls are drawn from numpy in bulk and handed out one at a time by rollDie
+ROLL_BUFFER_SIZE = 65536
 
-    return sum
+roll_generator = np.random.default_rng()
+roll_buffer = []
+roll_index = 0
 
 
 def rollDie() -> int:
@@ -52,7 +39,18 @@ def rollDie() -> int:
 
     """
 
-    return random.randint(1, 6)
+    global roll_buffer, roll_index
+
+    # refill the buffer once every roll in it has been used
+    if roll_index >= len(roll_buffer):
+        roll_buffer = roll_generator.integers(
+            1, 7, size=ROLL_BUFFER_SIZE).tolist()
+        roll_index = 0
+
+    roll = roll_buffer[roll_index]
+    roll_index += 1
+
+    return roll
 
 
 def createJSON(data: dict, filepath: str, filename: str) -> None:
@@ -79,8 +77,8 @@ def createJSON(data: dict, filepath: str, filename: str) -> None:
 
     """
 
-    with open(os.path.join(filepath, filename), 'w') as outfile:
-        json.dump(data, outfile)
+    with open(os.path.join(filepath, filename), 'wb') as outfile:
+        outfile.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
 
 
 def readJSON(filepath: str, filename: str) -> dict:
@@ -105,8 +103,63 @@ def readJSON(filepath: str, filename: str) -> dict:
 
     """
 
-    with open(os.path.join(filepath, filename), 'r') as infile:
-        data = json.load(infile)
+    with open(os.path.join(filepath, filename), 'rb') as infile:
+        data = orjson.loads(infile.read())
+
+    return data
+
+
+def createNPZ(data: dict, filepath: str, filename: str) -> None:
+    """
+
+    creates a compressed .npz file with the given arrays
+
+    Parameters:
+    -----------
+
+    data: dict
+        dictionary of numpy arrays to be saved in the .npz file, keyed by name.
+
+    filepath: str
+        path to store the .npz file in.
+
+    filename: str
+        name of the .npz file to create. must include the .npz filetype ending.
+
+    Returns:
+    --------
+
+    None
+
+    """
+
+    np.savez_compressed(os.path.join(filepath, filename), **data)
+
+
+def readNPZ(filepath: str, filename: str) -> dict:
+    """
+
+    reads a .npz file and returns the arrays contained within
+
+    Parameters:
+    -----------
+
+    filepath: str
+        path to read the .npz file from.
+
+    filename: str
+        name of the .npz file to read arrays from. must include the .npz filetype ending.
+
+    Returns:
+    --------
+
+    data: dict
+        dictionary of numpy arrays read from the .npz file, keyed by name.
+
+    """
+
+    with np.load(os.path.join(filepath, filename)) as infile:
+        data = dict(infile)
 
     return data
 
@@ -120,9 +173,49 @@ class decisionFunction():
         self.decision_function = decision_function
         self.constant_parameters = constant_parameters
 
-    def getDecision(self, winning_score, current_score, opponent_score, current_rolls):
+        # id used by the compiled game kernel (None for functions the kernel doesn't know)
+        self.kernel_id = DECISION_IDS.get(decision_function)
+
+        # lookup tables for built-in decision functions that only depend on the turn sum or on the last roll (None otherwise)
+        self.turn_table = None
+        self.roll_table = None
+
+        # parameters passed to the compiled game kernel (None for functions the kernel doesn't know, whose constant
+        # parameters can be anything)
+        self.kernel_parameters = None
 
-        return self.decision_function(winning_score, current_score, opponent_score,  current_rolls, self.constant_parameters)
+        if self.kernel_id is None:
+            return
+
+        if decision_function in TURN_TABLES:
+            self.turn_table = TURN_TABLES[decision_function](
+                constant_parameters)
+
+        if decision_function in ROLL_TABLES:
+            self.roll_table = ROLL_TABLES[decision_function](
+                constant_parameters)
+
+        if self.turn_table is not None:
+            self.kernel_parameters = self.turn_table.astype(np.int64)
+
+        elif self.roll_table is not None:
+            self.kernel_parameters = self.roll_table.astype(np.int64)
+
+        else:
+
+            kernel_parameters = []
+            for parameter in constant_parameters:
+                if isinstance(parameter, list):
+                    kernel_parameters.extend(parameter)
+                else:
+                    kernel_parameters.append(parameter)
+
+            self.kernel_parameters = np.array(
+                kernel_parameters, dtype=np.int64)
+
+    def getDecision(self, winning_score, current_score, opponent_score, turn_sum, last_roll):
+
+        return self.decision_function(winning_score, current_score, opponent_score, turn_sum, last_roll, self.constant_parameters)
 
 
 class strategy():
@@ -134,39 +227,290 @@ class strategy():
         # strategy name
         self.name = name
 
-        # winning and current scores
-        self.winning_score = 0
-        self.current_score = 0
-
         # decision function (parameters included)
         self.decision_function = decision_function
 
-    def getDecision(self, opponent_score: int, current_rolls: list) -> bool:
+        # the decision function with its constant parameters bound, called directly by runSimulation
+        function = decision_function.decision_function
+        parameters = decision_function.constant_parameters
+
+        if decision_function.turn_table is not None:
+
+            # table lookup instead of a call to the decision function
+            turn_table = decision_function.turn_table.tolist()
+            self.decide = lambda winning_score, current_score, opponent_score, turn_sum, last_roll: turn_table[
+                turn_sum]
+
+        elif decision_function.roll_table is not None:
+
+            roll_table = decision_function.roll_table.tolist()
+            self.decide = lambda winning_score, current_score, opponent_score, turn_sum, last_roll: roll_table[
+                last_roll]
+
+        elif function in DECISION_FACTORIES:
+
+            # closure with the constant parameters already bound
+            self.decide = DECISION_FACTORIES[function](parameters)
+
+        else:
+
+            self.decide = lambda winning_score, current_score, opponent_score, turn_sum, last_roll: function(
+                winning_score, current_score, opponent_score, turn_sum, last_roll, parameters)
+
+        # plays a whole turn without per-roll decisions, for decision functions that have a turn function (None otherwise)
+        self.fast_turn = None
+
+        if function in TURN_FUNCTIONS:
+            turn_function = TURN_FUNCTIONS[function]
+            self.fast_turn = lambda winning_score, current_score: turn_function(
+                winning_score, current_score, parameters)
+
+    def getDecision(self, winning_score: int, current_score: int, opponent_score: int, turn_sum: int, last_roll: int) -> bool:
         """
         given parameters a player can take into account, make a decision as to whether the strategy should accept the current score or roll again.
 
         Parameters:
         -----------
 
+        winning_score: int
+            integer representing the score needed to win a game.
+
+        current_score: int
+            integer representing the strategy's banked score.
+
         opponent_score: int
             integer representing the oppoenent strategy's score.
 
-        current_rolls: list
-            list of integers representing the current roll-set.
+        turn_sum: int
+            integer representing the sum of the rolls made so far this turn.
+
+        last_roll: int
+            integer representing the most recent roll.
 
         Returns:
         --------
 
         decision: bool
-            boolean representing the strategy's decision. True if accept, False if roll again.
+            boolean representing the strategy's decision. True if roll again, False if accept.
 
         """
 
-        return self.decision_function.getDecision(self.winning_score, self.current_score, opponent_score, current_rolls)
+        return self.decide(winning_score, current_score, opponent_score, turn_sum, last_roll)
+
+# ----- compiled game kernel -----
+
+
+# integer ids for the built-in decision functions, used by the compiled game kernel
+RANDOM_DECISION = 0
+UNTIL_VALUE = 1
+UNTIL_ROLL = 2
+ALWAYS_TRUE = 3
+ALWAYS_FALSE = 4
+AGRO_AFTER = 5
+AGRO_AFTER_OPPONENT = 6
+BEAT_OPPONENT = 7
+
+
+@numba.njit(cache=True)
+def _kernelDecision(strategy_id, parameters, winning_score, current_score, opponent_score, turn_sum, roll):
+    """
+
+    compiled equivalent of the built-in decision functions. True if roll again, False if stop.
+
+    """
+
+    # untilValue and untilRoll are passed their lookup tables as parameters
+    if strategy_id == UNTIL_VALUE:
+        return parameters[turn_sum] != 0
+
+    elif strategy_id == UNTIL_ROLL:
+        return parameters[roll] != 0
+
+    elif strategy_id == ALWAYS_TRUE:
+        return True
+
+    elif strategy_id == ALWAYS_FALSE:
+        return False
+
+    elif strategy_id == AGRO_AFTER:
+        if (winning_score - current_score) <= parameters[0]:
+            return True
+
+    elif strategy_id == AGRO_AFTER_OPPONENT:
+        if (winning_score - opponent_score) <= parameters[0]:
+            return True
+
+    elif strategy_id == BEAT_OPPONENT:
+        if current_score < opponent_score:
+            return True
+
+    # randomDecision, and the fallback for the partially random strategies
+    return np.random.random() < 0.5
+
+
+@numba.njit(cache=True)
+def _kernelTurn(strategy_id, parameters, winning_score, current_score, opponent_score):
+    """
+
+    plays a single turn for a strategy and returns the points it banks.
+
+    """
+
+    turn_sum = 0
+    while current_score + turn_sum < winning_score:
+
+        roll = np.random.randint(1, 7)
+
+        if roll == 1:
+            return 0
+
+        turn_sum += roll
+        if not _kernelDecision(strategy_id, parameters, winning_score, current_score, opponent_score, turn_sum, roll):
+            break
+
+    return turn_sum
+
+
+@numba.njit(cache=True)
+def _simulateGame(strategy_1_id, strategy_1_parameters, strategy_2_id, strategy_2_parameters, winning_score):
+    """
+
+    compiled equivalent of runSimulation. returns the margin of the game; positive if strategy_1 won, negative if strategy_2 won.
+
+    """
+
+    score_1 = 0
+    score_2 = 0
+
+    while True:
+
+        score_1 += _kernelTurn(strategy_1_id, strategy_1_parameters,
+                               winning_score, score_1, score_2)
+        if score_1 >= winning_score:
+            return winning_score - score_2
+
+        score_2 += _kernelTurn(strategy_2_id, strategy_2_parameters,
+                               winning_score, score_2, score_1)
+        if score_2 >= winning_score:
+            return -(winning_score - score_1)
+
+
+@numba.njit(cache=True, parallel=True, nogil=True)
+def _simulateBlock(strategy_1_id, strategy_1_parameters, strategy_2_id, strategy_2_parameters, winning_score, games):
+    """
+
+    runs a block of games in parallel. returns an array of the game margins; positive if strategy_1 won, negative if strategy_2 won.
+
+    """
+
+    margins = np.empty(games, dtype=np.int32)
+
+    for i in numba.prange(games):
+        margins[i] = _simulateGame(strategy_1_id, strategy_1_parameters,
+                                   strategy_2_id, strategy_2_parameters, winning_score)
+
+    return margins
 
 # ----- create functions to test strategies against one another -----
 
 
+def runSimulationMargin(strategy_1: strategy, strategy_2: strategy, winning_score: int) -> int:
+    """
+    runs a single simulation of a game between two strategies, and returns the signed margin.
+
+    Parameters:
+    -----------
+
+    strategy_1: strategy object
+        strategy object for the first strategy in the simulation.
+
+    strategy_2: strategy object
+        strategy object for the second strategy in the simulation.
+
+    winning_score: int
+        integer representing the score needed to win a game.
+
+    Returns:
+    --------
+
+    margin: int
+        margin of the game; positive if strategy_1 won, negative if strategy_2 won.
+
+    """
+
+    # built-in decision functions run in the compiled kernel
+    if strategy_1.decision_function.kernel_id is not None and strategy_2.decision_function.kernel_id is not None:
+
+        return _simulateGame(strategy_1.decision_function.kernel_id, strategy_1.decision_function.kernel_parameters,
+                             strategy_2.decision_function.kernel_id, strategy_2.decision_function.kernel_parameters, winning_score)
+
+    # scores are kept locally so that a strategy object can play against itself
+
+    score_1 = 0
+    score_2 = 0
+
+    decide_1 = strategy_1.decide
+    decide_2 = strategy_2.decide
+
+    fast_turn_1 = strategy_1.fast_turn
+    fast_turn_2 = strategy_2.fast_turn
+
+    # loop the turns until one strategy gets enough points to win
+    while True:
+
+        # strategy_1 turn
+        turn_sum = 0
+        if fast_turn_1 is not None:
+            turn_sum = fast_turn_1(winning_score, score_1)
+
+        else:
+            while (score_1 + turn_sum < winning_score):
+
+                roll = rollDie()
+
+                if roll == 1:
+                    turn_sum = 0  # reset the turn so that the strategy has no points added
+                    break
+
+                else:
+                    # add the result of the roll to the turn
+                    turn_sum += roll
+                    if not decide_1(winning_score, score_1, score_2, turn_sum, roll):
+                        break
+
+        score_1 += turn_sum  # update the score of strategy_1
+
+        # check that strategy_1 has not won yet; if so, game is over
+        if score_1 >= winning_score:
+            return winning_score - score_2
+
+        # strategy_2 turn
+        turn_sum = 0
+        if fast_turn_2 is not None:
+            turn_sum = fast_turn_2(winning_score, score_2)
+
+        else:
+            while (score_2 + turn_sum < winning_score):
+
+                roll = rollDie()
+
+                if roll == 1:
+                    turn_sum = 0  # reset the turn so that the strategy has no points added
+                    break
+
+                else:
+                    # add the result of the roll to the turn
+                    turn_sum += roll
+                    if not decide_2(winning_score, score_2, score_1, turn_sum, roll):
+                        break
+
+        score_2 += turn_sum  # update the score of strategy_2
+
+        # check that strategy_2 has not won yet; if so, game is over
+        if score_2 >= winning_score:
+            return -(winning_score - score_1)
+
+
 def runSimulation(strategy_1: strategy, strategy_2: strategy, winning_score: int) -> list:
     """
     runs a single simulation of a game between two strategies.
@@ -192,93 +536,357 @@ def runSimulation(strategy_1: strategy, strategy_2: strategy, winning_score: int
 
     """
 
-    # ensure both strategies have their scores reset, and the winning score updated
+    margin = runSimulationMargin(strategy_1, strategy_2, winning_score)
 
-    strategy_1.winning_score = winning_score
-    strategy_1.current_score = 0
+    if margin > 0:
+        return [strategy_1.name, margin]
+    else:
+        return [strategy_2.name, -margin]
 
-    strategy_2.winning_score = winning_score
-    strategy_2.current_score = 0
 
-    # loop the turns until one strategy gets enough points to win
-    while True:
+def runSimulationBlock(strategy_1: strategy, strategy_2: strategy, winning_score: int, games: int) -> dict:
+    """
 
-        # strategy_1 turn
-        current_moves = []
-        while (strategy_1.current_score + sumList(current_moves) < winning_score):
+    runs a set of simulations between two strategies.
+
+    Parameters:
+    -----------
+
+    strategy_1: strategy object
+        strategy object for the first strategy in the simulation.
+
+    strategy_2: strategy object
+        strategy object for the second strategy in the simulation.
+
+    winning_score: int
+        integer representing the score needed to win a game.
+
+    games: int
+        integer representing the number of games to simulate.
+
+    Returns:
+    --------
+
+    results: dict
+        dictionary of results. formatted as follows:
+        {
+            "game_settings": {
+                "game_count": number of games played,
+                "winning_score": winning score,
+                "strategy_1": strategy_1.name,
+                "strategy_2": strategy_2.name
+            },
+            "win_count" : [strategy_1_wins, strategy_2_wins],
+            "win_margins" : [strategy_1_win_margin_array, strategy_2_win_margin_array]
+            "average_margins" : [strategy_1_average_margin, strategy_2_average_margin]
+        }
+
+    """
+
+    print(
+        f"running {str(games)} simulations for {strategy_1.name} vs. {strategy_2.name}: \n")
+
+    # ----- run the games -----
+
+    if strategy_1.decision_function.kernel_id is not None and strategy_2.decision_function.kernel_id is not None:
+
+        # built-in decision functions, run every game in the compiled kernel
+        margins = _simulateBlock(strategy_1.decision_function.kernel_id, strategy_1.decision_function.kernel_parameters,
+                                 strategy_2.decision_function.kernel_id, strategy_2.decision_function.kernel_parameters, winning_score, games)
+        winner_mask = margins > 0
+
+    else:
+
+        # signed margins, positive when strategy_1 won, one entry per game
+        margins = np.empty(games, dtype=np.int32)
+
+        for i in range(0, games):
+
+            margins[i] = runSimulationMargin(
+                strategy_1, strategy_2, winning_score)
+
+            # progress update every 1000 games; printing every game costs more than playing it
+            if i % 1000 == 0:
+                print(f"     game {i} of {games}: {margins[i]}")
+
+        winner_mask = margins > 0
+
+    # ----- create the results dictionary -----
+
+    results = {
+        "game_settings": {
+            "game_count": games,
+            "winning_score": winning_score,
+            "strategy_1": strategy_1.name,
+            "strategy_2": strategy_2.name
+        }
+    }
+
+    # assemble win count, margins
+
+    strategy_1_wins = int(winner_mask.sum())
+    strategy_2_wins = games - strategy_1_wins
+
+    results["win_count"] = [strategy_1_wins, strategy_2_wins]
+    results["win_margins"] = [margins, -margins]
+
+    # assemble average win margins
+
+    results["average_margins"] = [float(margins.mean()), float(-margins.mean())]
+
+    print(
+        f"     {strategy_1.name} won {strategy_1_wins}, {strategy_2.name} won {strategy_2_wins}\n")
+
+    # ----- return final results dict -----
+
+    return results
+
+
+# ----- exact solutions for deterministic strategies -----
+
+
+def isDeterministic(current_strategy: strategy) -> bool:
+    """
+
+    checks whether a strategy's turns depend on nothing but the dice, so that its games can be solved exactly.
+
+    Parameters:
+    -----------
+
+    current_strategy: strategy object
+        strategy object to check.
+
+    Returns:
+    --------
+
+    deterministic: bool
+        True if the strategy's decision function has a turn function (see TURN_FUNCTIONS), False otherwise.
+
+    """
+
+    return current_strategy.decision_function.decision_function in TURN_FUNCTIONS
+
+
+def turnDistribution(decision_function: decisionFunction, winning_score: int) -> np.ndarray:
+    """
+
+    computes the exact distribution of the points banked in a turn, for every score the strategy could start the turn on.
+
+    only valid for decision functions with a turn function (see TURN_FUNCTIONS), since those depend on nothing but the turn itself.
+
+    Parameters:
+    -----------
+
+    decision_function: decisionFunction object
+        decision function of the strategy.
+
+    winning_score: int
+        integer representing the score needed to win a game.
+
+    Returns:
+    --------
+
+    distribution: np.ndarray
+        array of shape (winning_score, winning_score + 6); distribution[current_score, points] is the probability of banking points.
+
+    """
+
+    distribution = np.zeros((winning_score, winning_score + 6))
+
+    for current_score in range(winning_score):
+
+        target = winning_score - current_score
+
+        # probability of still rolling with each turn sum
+        rolling = np.zeros(target + 6)
+        rolling[0] = 1
+
+        for turn_sum in range(target):
+
+            probability = rolling[turn_sum] / 6
+            if probability == 0:
+                continue
+
+            # rolling a 1 banks nothing
+            distribution[current_score, 0] += probability
+
+            for roll in range(2, 7):
+
+                if turn_sum + roll >= target or not decision_function.getDecision(winning_score, current_score, 0, turn_sum + roll, roll):
+                    distribution[current_score, turn_sum + roll] += probability
+                else:
+                    rolling[turn_sum + roll] += probability
+
+    return distribution
+
+
+@numba.njit(cache=True)
+def _solveGame(distribution_1, distribution_2, winning_score):
+    """
+
+    solves the markov chain of a game between two strategies with the given turn distributions, by backward recursion.
+
+    returns strategy_1's win probability and expected margin from the start of the game.
+
+    """
+
+    # values[mover, score_1, score_2] = (strategy_1 win probability, expected margin) with mover about to play
+    values = np.zeros((2, winning_score, winning_score, 2))
+
+    # every turn that banks points moves to a higher total score, so states are solved from the highest total down
+    for score_1 in range(winning_score - 1, -1, -1):
+        for score_2 in range(winning_score - 1, -1, -1):
+
+            # value of each mover's turn over the outcomes that bank points
+            win_1 = 0.0
+            margin_1 = 0.0
+            win_2 = 0.0
+            margin_2 = 0.0
+
+            for points in range(2, winning_score + 6):
+
+                probability = distribution_1[score_1, points]
+                if probability > 0:
+                    if score_1 + points >= winning_score:
+                        win_1 += probability
+                        margin_1 += probability * (winning_score - score_2)
+                    else:
+                        win_1 += probability * \
+                            values[1, score_1 + points, score_2, 0]
+                        margin_1 += probability * \
+                            values[1, score_1 + points, score_2, 1]
+
+                probability = distribution_2[score_2, points]
+                if probability > 0:
+                    if score_2 + points >= winning_score:
+                        margin_2 -= probability * (winning_score - score_1)
+                    else:
+                        win_2 += probability * \
+                            values[0, score_1, score_2 + points, 0]
+                        margin_2 += probability * \
+                            values[0, score_1, score_2 + points, 1]
+
+            # a 1 passes the turn without changing the scores, so the two movers' values at (score_1, score_2) depend on
+            # each other; solve that 2x2 system directly
+            bust_1 = distribution_1[score_1, 0]
+            bust_2 = distribution_2[score_2, 0]
+            denominator = 1 - bust_1 * bust_2
+
+            values[0, score_1, score_2, 0] = (
+                win_1 + bust_1 * win_2) / denominator
+            values[0, score_1, score_2, 1] = (
+                margin_1 + bust_1 * margin_2) / denominator
+
+            values[1, score_1, score_2, 0] = bust_2 * \
+                values[0, score_1, score_2, 0] + win_2
+            values[1, score_1, score_2, 1] = bust_2 * \
+                values[0, score_1, score_2, 1] + margin_2
+
+    return values[0, 0, 0, 0], values[0, 0, 0, 1]
+
+
+def solveMatchup(strategy_1: strategy, strategy_2: strategy, winning_score: int, distributions: list = None) -> dict:
+    """
+
+    solves a game between two deterministic strategies exactly, as an absorbing markov chain, instead of simulating it.
+
+    states are (strategy_1 score, strategy_2 score, player to move); the win probability and the expected margin are found
+    by backward recursion over the total score.
+
+    Parameters:
+    -----------
+
+    strategy_1: strategy object
+        strategy object for the first strategy in the game. its decision function must have a turn function.
+
+    strategy_2: strategy object
+        strategy object for the second strategy in the game. its decision function must have a turn function.
+
+    winning_score: int
+        integer representing the score needed to win a game.
+
+    distributions: list
+        optional [strategy_1_distribution, strategy_2_distribution], as returned by turnDistribution. computed if not given.
+
+    Returns:
+    --------
+
+    results: dict
+        dictionary of results. formatted as follows:
+        {
+            "game_settings": {
+                "winning_score": winning score,
+                "strategy_1": strategy_1.name,
+                "strategy_2": strategy_2.name
+            },
+            "win_probability" : [strategy_1_win_probability, strategy_2_win_probability],
+            "average_margins" : [strategy_1_expected_margin, strategy_2_expected_margin]
+        }
 
-            roll = rollDie()
+    """
 
-            if roll == 1:
-                current_moves = []  # reset the moves so that the strategy has no points added
-                break
+    for current_strategy in (strategy_1, strategy_2):
+        if not isDeterministic(current_strategy):
+            raise ValueError(
+                f"{current_strategy.name} is not deterministic, so it can't be solved exactly")
 
-            else:
-                # add the result of the roll to the moves list
-                current_moves.append(roll)
-                if not strategy_1.getDecision(strategy_2.current_score, current_moves):
-                    break
+    if distributions is None:
+        distributions = [turnDistribution(strategy_1.decision_function, winning_score),
+                         turnDistribution(strategy_2.decision_function, winning_score)]
 
-        strategy_1.current_score = strategy_1.current_score + \
-            sumList(current_moves)  # update the score of strategy_1
+    win_probability, margin = _solveGame(
+        distributions[0], distributions[1], winning_score)
 
-        # check that strategy_1 has not won yet; if so, game is over
-        if strategy_1.current_score >= winning_score:
-            break
+    return {
+        "game_settings": {
+            "winning_score": winning_score,
+            "strategy_1": strategy_1.name,
+            "strategy_2": strategy_2.name
+        },
+        "win_probability": [float(win_probability), 1 - float(win_probability)],
+        "average_margins": [float(margin), -float(margin)]
+    }
 
-        # strategy_2 turn
-        current_moves = []
-        while (strategy_2.current_score + sumList(current_moves) < winning_score):
 
-            roll = rollDie()
+strategies = []
 
-            if roll == 1:
-                current_moves = []  # reset the moves so that the strategy has no points added
-                break
+# ----- test all strategies against one another -----
 
-            else:
-                # add the result of the roll to the moves list
-                current_moves.append(roll)
-                if not strategy_2.getDecision(strategy_1.current_score, current_moves):
-                    break
 
-        strategy_2.current_score = strategy_2.current_score + \
-            sumList(current_moves)  # update the score of strategy_2
+# separates the two strategy names in the match keys of match_data.npz
+MATCH_SEPARATOR = "__"
 
-        # check that strategy_2 has not won yet; if so, game is over
-        if strategy_2.current_score >= winning_score:
-            break
 
-    # someone has now won, return results accordingly
-    winner = ""
-    margin = 0
+def _initialiseWorker() -> None:
+    """
 
-    if strategy_1.current_score >= winning_score:
+    limits each worker process to a single numba thread, since testStrategies already runs one match per core, and gives
+    each worker its own die roll generator (forked workers would otherwise share the parent's generator state).
 
-        winner = strategy_1.name
-        margin = 100 - strategy_2.current_score
+    """
 
-    else:
+    global roll_generator, roll_buffer, roll_index
 
-        winner = strategy_2.name
-        margin = 100 - strategy_1.current_score
+    numba.set_num_threads(1)
 
-    return [winner, margin]
+    roll_generator = np.random.default_rng()
+    roll_buffer = []
+    roll_index = 0
 
 
-def runSimulationBlock(strategy_1: strategy, strategy_2: strategy, winning_score: int, games: int) -> dict:
+def _runBlockWorker(strategy_1_settings: tuple, strategy_2_settings: tuple, winning_score: int, games: int) -> dict:
     """
 
-    runs a set of simulations between two strategies.
+    rebuilds two strategies in a worker process and runs a block of simulations between them.
 
     Parameters:
     -----------
 
-    strategy_1: strategy object
-        strategy object for the first strategy in the simulation.
+    strategy_1_settings: tuple
+        (name, decisionFunction) for the first strategy in the simulation.
 
-    strategy_2: strategy object
-        strategy object for the second strategy in the simulation.
+    strategy_2_settings: tuple
+        (name, decisionFunction) for the second strategy in the simulation.
 
     winning_score: int
         integer representing the score needed to win a game.
@@ -290,90 +898,120 @@ def runSimulationBlock(strategy_1: strategy, strategy_2: strategy, winning_score
     --------
 
     results: dict
-        dictionary of results. formatted as follows:
-        {
-            "game_settings": {
-                "game_count": number of games played,
-                "winning_score": winning score,
-                "strategy_1": strategy_1.name,
-                "strategy_2": strategy_2.name
-            },
-            "win_count" : [strategy_1_wins, strategy_2_wins],
-            "win_margins" : [strategy_1_win_margin_list, strategy_2_win_margin_list]
-            "average_margins" : [strategy_1_average_margin, strategy_2_average_margin]
-        }
+        dictionary of results, as returned by runSimulationBlock.
 
     """
 
-    print(
-        f"running {str(games)} simulations for {strategy_1.name} vs. {strategy_2.name}: \n")
-
-    # ----- run the games -----
+    return runSimulationBlock(strategy(*strategy_1_settings), strategy(*strategy_2_settings), winning_score, games)
 
-    results_list = []
 
-    for i in range(0, games):
+def aggregateMatchData(match_data: dict, solved_data: dict = None) -> dict:
+    """
 
-        results = runSimulation(strategy_1, strategy_2, winning_score)
-        results_list.append(results)
+    aggregates the margins of a set of matches into per-strategy results.
 
-        print(f"     game {i} of {games}: {results}")
+    Parameters:
+    -----------
 
-    # ----- create the results dictionary -----
+    match_data: dict
+        dictionary of match margins, as saved to match_data.npz by testStrategies. formatted as follows:
+        {
+            f"{strategy_1_name}{MATCH_SEPARATOR}{strategy_2_name}": array of game margins, positive when strategy_1 won
+        }
 
-    results = {
-        "game_settings": {
-            "game_count": games,
-            "winning_score": winning_score,
-            "strategy_1": strategy_1.name,
-            "strategy_2": strategy_2.name
+    solved_data: dict
+        dictionary of exactly solved matches, as saved to solved_data.npz by testStrategies. formatted as follows:
+        {
+            f"{strategy_1_name}{MATCH_SEPARATOR}{strategy_2_name}": [game count, strategy_1 win probability, strategy_1 expected margin]
         }
-    }
+        solved matches add their expected wins, losses and margins to the counters.
 
-    # assemble win count, margins
+    Returns:
+    --------
 
-    strategy_1_wins = 0
-    strategy_2_wins = 0
-    strategy_1_margins = []
-    strategy_2_margins = []
+    aggregated_results: dict
+        dictionary containing aggregated results, in the format returned by testStrategies.
 
-    for result in results_list:
+    """
 
-        if result[0] == strategy_1.name:
+    # flat counters for each strategy; rates and averages are only computed once every match has been played
+    records = defaultdict(lambda: {
+        "games_played": 0,
+        "wins_first": 0,
+        "losses_first": 0,
+        "wins_second": 0,
+        "losses_second": 0,
+        "margin_sum": 0,
+        "match_count": 0
+    })
 
-            strategy_1_wins += 1
-            strategy_1_margins.append(result[1])
-            strategy_2_margins.append(-result[1])
+    # game count, strategy_1 wins and strategy_1 margin sum for every match
+    match_totals = {}
 
-        else:
+    for match_name, margins in match_data.items():
+        match_totals[match_name] = (
+            len(margins), int((margins > 0).sum()), int(margins.sum()))
 
-            strategy_2_wins += 1
-            strategy_2_margins.append(result[1])
-            strategy_1_margins.append(-result[1])
+    if solved_data is not None:
+        for match_name, (game_count, win_probability, average_margin) in solved_data.items():
+            match_totals[match_name] = (
+                int(game_count), win_probability * game_count, average_margin * game_count)
 
-    results["win_count"] = [strategy_1_wins, strategy_2_wins]
-    results["win_margins"] = [strategy_1_margins, strategy_2_margins]
+    for match_name, (game_count, strategy_1_wins, strategy_1_margin_sum) in match_totals.items():
 
-    # assemble average win margins
+        strategy_1_name, strategy_2_name = match_name.split(MATCH_SEPARATOR)
 
-    strategy_1_average = (
-        sumList(results["win_margins"][0]))/(len(results["win_margins"][0]))
-    strategy_2_average = (
-        sumList(results["win_margins"][1]))/(len(results["win_margins"][1]))
+        # the second strategy's wins and margins are the complement of the first's
+        for strategy_name, column, wins, margin_sum in ((strategy_1_name, "first", strategy_1_wins, strategy_1_margin_sum),
+                                                        (strategy_2_name, "second", game_count - strategy_1_wins, -strategy_1_margin_sum)):
 
-    results["average_margins"] = [strategy_1_average, strategy_2_average]
+            record = records[strategy_name]
 
-    # ----- return final results dict -----
+            record["games_played"] += game_count
+            record[f"wins_{column}"] += wins
+            record[f"losses_{column}"] += game_count - wins
+            record["margin_sum"] += margin_sum
+            record["match_count"] += 1
 
-    return results
+    # assemble the aggregate results from the counters
 
+    aggregate_results = {}
 
-strategies = []
+    for strategy_name, record in records.items():
 
-# ----- test all strategies against one another -----
+        win_loss_rate = {
+            "overall": {
+                "wins": record["wins_first"] + record["wins_second"],
+                "losses": record["losses_first"] + record["losses_second"]
+            },
+            "first": {
+                "wins": record["wins_first"],
+                "losses": record["losses_first"]
+            },
+            "second": {
+                "wins": record["wins_second"],
+                "losses": record["losses_second"]
+            }
+        }
+
+        # add winrates to each column
+        for column in win_loss_rate.values():
+            column["rate"] = column["wins"] / \
+                (column["wins"] + column["losses"])
+
+        aggregate_results[strategy_name] = {
+            "games_played": record["games_played"],
+            "average_margin": {
+                "average": record["margin_sum"]/record["games_played"],
+                "match_count": record["match_count"]
+            },
+            "win_loss_rate": win_loss_rate
+        }
+
+    return aggregate_results
 
 
-def testStrategies(strategies: list, winning_score: int, vs_count: int) -> dict:
+def testStrategies(strategies: list, winning_score: int, vs_count: int, exact: bool = True) -> dict:
     """
 
     tests a set of strategies against each other
@@ -390,6 +1028,10 @@ def testStrategies(strategies: list, winning_score: int, vs_count: int) -> dict:
     vs_count: int
         integer representing the number of games strategies should play against each other.
 
+    exact: bool
+        if True, matches between two deterministic strategies are solved exactly with solveMatchup instead of being
+        simulated; their wins and losses are then the expected counts over vs_count games.
+
     Returns:
     --------
 
@@ -429,192 +1071,62 @@ def testStrategies(strategies: list, winning_score: int, vs_count: int) -> dict:
 
     # test all strategies against each other
 
-    # for strategy_1 in strategies:  # this gets the first strategy
-
-    #     for strategy_2 in strategies:  # this gets the second strategy
-
-    #         createJSON(runSimulationBlock(strategy_1, strategy_2, winning_score,
-    #                    vs_count), "./match_data/", f"{strategy_1.name}-{strategy_2.name}.json")
-
-    # aggregate the results
-    aggregate_results = {}
-
-    current_results = {}  # results currently being processed
-
-    for filename in os.listdir("./match_data"):
-
-        current_results = readJSON("./match_data", filename)
-
-        # update data for first strategy in the match
-        try:
-            current_strategy = aggregate_results[current_results["game_settings"]["strategy_1"]]
-
-            aggregate_results[current_results["game_settings"]["strategy_1"]] = {
-
-                # games played
-                "games_played": current_strategy["games_played"] + current_results["game_settings"]["game_count"],
-
-                # marginal averages
-                "average_margin": {
-                    "average": (current_strategy["average_margin"]["average"] * current_strategy["average_margin"]["match_count"] + current_results["average_margins"][0]/(10000 * current_strategy["average_margin"]["match_count"]+1)),
-                    "match_count": current_strategy["average_margin"]["match_count"] + 1
-                },
-
-                #wins and losses
-                "win_loss_rate": {
-
-                    # overall
-                    "overall": {
-                        "wins": current_strategy["win_loss_rate"]["overall"]["wins"] + current_results["win_count"][0],
-                        "losses": current_strategy["win_loss_rate"]["overall"]["losses"] + (current_results["game_settings"]["game_count"] - current_results["win_count"][0]),
-                    },
-
-                    # because this was the first strategy, update the first win-loss-rate column
-                    "first": {
-                        "wins": current_strategy["win_loss_rate"]["first"]["wins"] + current_results["win_count"][0],
-                        "losses": current_strategy["win_loss_rate"]["first"]["losses"] + (current_results["game_settings"]["game_count"] - current_results["win_count"][0])
-                    },
-
-                    # copy the 'when this strategy is the second strategy' statistics; no new computation required
-                    "second": {
-                        "wins": current_strategy["win_loss_rate"]["second"]["wins"],
-                        "losses": current_strategy["win_loss_rate"]["second"]["losses"]
-                    }
-
-                }
-            }
-
-        except KeyError as error:  # should only occur when strategy hasn't been recorded yet
-
-            aggregate_results[current_results["game_settings"]["strategy_1"]] = {
-
-                # games played
-                "games_played": current_results["game_settings"]["game_count"],
-
-                # marginal averages
-                "average_margin": {
-                    "average": (current_results["average_margins"][0]/10000),
-                    "match_count": 1
-                },
-
-                #wins and losses
-                "win_loss_rate": {
-
-                    # overall
-                    "overall": {
-                        "wins": current_results["win_count"][0],
-                        "losses": (current_results["game_settings"]["game_count"] - current_results["win_count"][0])
-                    },
-
-                    # because this was the first strategy, update the first win-loss-rate column
-                    "first": {
-                        "wins": current_results["win_count"][0],
-                        "losses": (current_results["game_settings"]["game_count"] - current_results["win_count"][0])
-                    },
-
-                    # this strategy has not been the 'second strategy' yet, so add some blanks
-                    "second": {
-                        "wins": 0,
-                        "losses": 0,
-                    }
-
-                }
-            }
-
-        # update data for second strategy in the match
-        try:
-            current_strategy = aggregate_results[current_results["game_settings"]["strategy_2"]]
-
-            aggregate_results[current_results["game_settings"]["strategy_2"]] = {
-
-                # games played
-                "games_played": current_strategy["games_played"] + current_results["game_settings"]["game_count"],
-
-                # marginal averages
-                "average_margin": {
-                    "average": (current_strategy["average_margin"]["average"] * current_strategy["average_margin"]["match_count"] + current_results["average_margins"][0]/(10000 * current_strategy["average_margin"]["match_count"]+1)),
-                    "match_count": current_strategy["average_margin"]["match_count"] + 1
-                },
-
-                #wins and losses
-                "win_loss_rate": {
-
-                    # overall
-                    "overall": {
-                        "wins": current_strategy["win_loss_rate"]["overall"]["wins"] + current_results["win_count"][0],
-                        "losses": current_strategy["win_loss_rate"]["overall"]["losses"] + (current_results["game_settings"]["game_count"] - current_results["win_count"][0])
-                    },
-
-                    # copy the 'when this strategy is the first strategy' statistics; no new computation required
-                    "first": {
-                        "wins": current_strategy["win_loss_rate"]["first"]["wins"],
-                        "losses": current_strategy["win_loss_rate"]["first"]["losses"]
-                    },
-
-                    # because this was the first strategy, update the first win-loss-rate column
-                    "second": {
-                        "wins": current_strategy["win_loss_rate"]["second"]["wins"] + current_results["win_count"][0],
-                        "losses": current_strategy["win_loss_rate"]["second"]["losses"] + (current_results["game_settings"]["game_count"] - current_results["win_count"][0])
-                    }
-
-                }
-            }
+    # every ordered pair of strategies is an independent match, so the simulated matches are spread over a pool of
+    # processes. matches between two deterministic strategies are solved exactly rather than simulated
+    matches = []
+    solved_matches = []
 
-        except KeyError as error:  # should only occur when strategy hasn't been recorded yet
+    for strategy_1 in strategies:  # this gets the first strategy
 
-            aggregate_results[current_results["game_settings"]["strategy_2"]] = {
+        for strategy_2 in strategies:  # this gets the second strategy
 
-                # games played
-                "games_played": current_results["game_settings"]["game_count"],
+            if exact and isDeterministic(strategy_1) and isDeterministic(strategy_2):
+                solved_matches.append((strategy_1, strategy_2))
+            else:
+                matches.append(((strategy_1.name, strategy_1.decision_function),
+                                (strategy_2.name, strategy_2.decision_function), winning_score, vs_count))
 
-                # marginal averages
-                "average_margin": {
-                    "average": (current_results["average_margins"][0]/10000),
-                    "match_count": 1
-                },
+    with Pool(os.cpu_count(), initializer=_initialiseWorker) as pool:
+        match_results = pool.starmap(_runBlockWorker, matches)
 
-                # wins and losses
-                "win_loss_rate": {
+    # each deterministic strategy's turn distribution only needs computing once, however many matches it plays
+    distributions = {}
+    for strategy_1, strategy_2 in solved_matches:
+        for current_strategy in (strategy_1, strategy_2):
+            if current_strategy.name not in distributions:
+                distributions[current_strategy.name] = turnDistribution(
+                    current_strategy.decision_function, winning_score)
 
-                    # overall
-                    "overall": {
-                        "wins": current_results["win_count"][0],
-                        "losses": (current_results["game_settings"]["game_count"] - current_results["win_count"][0])
-                    },
+    solved_results = [solveMatchup(strategy_1, strategy_2, winning_score, [distributions[strategy_1.name], distributions[strategy_2.name]])
+                      for strategy_1, strategy_2 in solved_matches]
 
-                    # this strategy has not been the 'first strategy' yet, so add some blanks
-                    "first": {
-                        "wins": 0,
-                        "losses": 0,
-                    },
+    # keep the first strategy's margins for every simulated match, all in a single file
+    match_data = {}
 
-                    # update the second win-loss-rate column
-                    "second": {
-                        "wins": current_results["win_count"][0],
-                        "losses": (current_results["game_settings"]["game_count"] - current_results["win_count"][0])
-                    }
+    for current_results in match_results:
 
-                }
-            }
+        strategy_1_name = current_results["game_settings"]["strategy_1"]
+        strategy_2_name = current_results["game_settings"]["strategy_2"]
 
-    # add winrates to each strategy
+        match_data[f"{strategy_1_name}{MATCH_SEPARATOR}{strategy_2_name}"] = current_results["win_margins"][0]
 
-    for strategy_name in aggregate_results:
+    createNPZ(match_data, "./", "match_data.npz")
 
-        # overall winrate
+    # and the first strategy's win probability and expected margin for every solved match
+    solved_data = {}
 
-        aggregate_results[strategy_name]["win_loss_rate"]["overall"]["rate"] = aggregate_results[strategy_name]["win_loss_rate"]["overall"]["wins"]/(
-            aggregate_results[strategy_name]["win_loss_rate"]["overall"]["wins"] + aggregate_results[strategy_name]["win_loss_rate"]["overall"]["losses"])
+    for current_results in solved_results:
 
-        # first strategy winrate
+        strategy_1_name = current_results["game_settings"]["strategy_1"]
+        strategy_2_name = current_results["game_settings"]["strategy_2"]
 
-        aggregate_results[strategy_name]["win_loss_rate"]["first"]["rate"] = aggregate_results[strategy_name]["win_loss_rate"]["first"]["wins"]/(
-            aggregate_results[strategy_name]["win_loss_rate"]["first"]["wins"] + aggregate_results[strategy_name]["win_loss_rate"]["first"]["losses"])
+        solved_data[f"{strategy_1_name}{MATCH_SEPARATOR}{strategy_2_name}"] = np.array(
+            [vs_count, current_results["win_probability"][0], current_results["average_margins"][0]])
 
-        # second strategy winrate
+    createNPZ(solved_data, "./", "solved_data.npz")
 
-        aggregate_results[strategy_name]["win_loss_rate"]["second"]["rate"] = aggregate_results[strategy_name]["win_loss_rate"]["second"]["wins"]/(
-            aggregate_results[strategy_name]["win_loss_rate"]["second"]["wins"] + aggregate_results[strategy_name]["win_loss_rate"]["second"]["losses"])
+    # aggregate the results
+    aggregate_results = aggregateMatchData(match_data, solved_data)
 
     # save the results in a file
     createJSON(aggregate_results, "./", "aggregate_results.json")
@@ -629,14 +1141,14 @@ def testStrategies(strategies: list, winning_score: int, vs_count: int) -> dict:
 
 all of these should be defined as follows to prevent errors:
 
-def functionName(winning_score, current_score, opponent_score, current_rolls, constant_parameters) -> bool:
+def functionName(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters) -> bool:
 
     function-y stuff, blah blah blah ....
 
 """
 
 
-def untilValue(winning_score, current_score, opponent_score, current_rolls, constant_parameters) -> bool:
+def untilValue(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters) -> bool:
     """
 
     continues rolling until a certain total value is reached.
@@ -651,13 +1163,13 @@ def untilValue(winning_score, current_score, opponent_score, current_rolls, cons
 
     value = constant_parameters[0]
 
-    if sumList(current_rolls) >= value:
-        return True
-    else:
+    if turn_sum >= value:
         return False
+    else:
+        return True
 
 
-def untilRoll(winning_score, current_score, opponent_score, current_rolls, constant_parameters) -> bool:
+def untilRoll(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters) -> bool:
     """
 
     continues rolling unless a value in a set is rolled.
@@ -671,23 +1183,23 @@ def untilRoll(winning_score, current_score, opponent_score, current_rolls, const
     """
 
     # because this would be called every time, only need to check the most recent roll
-    if current_rolls[-1] in constant_parameters[0]:
+    if last_roll in constant_parameters[0]:
         return False
     else:
         return True
 
 
-def randomDecision(winning_score, current_score, opponent_score, current_rolls, constant_parameters) -> bool:
+def randomDecision(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters) -> bool:
     """
 
     returns a random decision, True or False.
 
     """
 
-    return [True, False][random.randint(0, 1)]
+    return random.random() < 0.5
 
 
-def alwaysTrue(winning_score, current_score, opponent_score, current_rolls, constant_parameters) -> bool:
+def alwaysTrue(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters) -> bool:
     """
 
     always continues to roll.
@@ -702,7 +1214,7 @@ def alwaysTrue(winning_score, current_score, opponent_score, current_rolls, cons
     return True
 
 
-def alwaysFalse(winning_score, current_score, opponent_score, current_rolls, constant_parameters) -> bool:
+def alwaysFalse(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters) -> bool:
     """
 
     always stops rolling.
@@ -717,7 +1229,7 @@ def alwaysFalse(winning_score, current_score, opponent_score, current_rolls, con
     return False
 
 
-def agroAfter(winning_score, current_score, oppponent_score, current_rolls, constant_parameters) -> bool:
+def agroAfter(winning_score, current_score, oppponent_score, turn_sum, last_roll, constant_parameters) -> bool:
     """
 
     after the strategy reaches a certain distance away from the winning score, play ultra aggressive. otherwise, chooses randomly.
@@ -733,10 +1245,10 @@ def agroAfter(winning_score, current_score, oppponent_score, current_rolls, cons
     if (winning_score - current_score) <= constant_parameters[0]:
         return True
     else:
-        return randomDecision(winning_score, current_score, oppponent_score, current_rolls, constant_parameters)
+        return randomDecision(winning_score, current_score, oppponent_score, turn_sum, last_roll, constant_parameters)
 
 
-def agroAfterOpponent(winning_score, current_score, opponent_score, current_rolls, constant_parameters) -> bool:
+def agroAfterOpponent(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters) -> bool:
     """
 
     after the opponent reaches a certain distance from the winning score, plays ultra aggressively. otherwise chooses randomly.
@@ -752,10 +1264,10 @@ def agroAfterOpponent(winning_score, current_score, opponent_score, current_roll
     if (winning_score - opponent_score) <= constant_parameters[0]:
         return True
     else:
-        return randomDecision(winning_score, current_score, opponent_score, current_rolls, constant_parameters)
+        return randomDecision(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters)
 
 
-def beatOpponent(winning_score, current_score, opponent_score, current_rolls, constant_parameters) -> bool:
+def beatOpponent(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters) -> bool:
     """
 
     plays aggressively until its score is higher than the opponent's. otherwise, chooses randomly.
@@ -770,8 +1282,213 @@ def beatOpponent(winning_score, current_score, opponent_score, current_rolls, co
     if current_score < opponent_score:
         return True
     else:
-        return randomDecision(winning_score, current_score, opponent_score, current_rolls, constant_parameters)
+        return randomDecision(winning_score, current_score, opponent_score, turn_sum, last_roll, constant_parameters)
+
+
+# ----- decision lookup tables -----
+
+
+def untilValueTable(constant_parameters) -> np.ndarray:
+    """
+
+    builds the lookup table for untilValue, indexed by the turn sum.
+
+    Returns:
+    --------
+
+    table: np.ndarray
+        boolean array; table[turn_sum] is the decision untilValue makes for that turn sum.
+
+    """
+
+    value = constant_parameters[0]
+
+    # a turn can't continue past value - 1, so the largest turn sum is value + 5
+    return np.arange(max(value, 0) + 7) < value
+
+
+def untilRollTable(constant_parameters) -> np.ndarray:
+    """
+
+    builds the lookup table for untilRoll, indexed by the last roll.
+
+    Returns:
+    --------
+
+    table: np.ndarray
+        boolean array; table[last_roll] is the decision untilRoll makes for that roll.
+
+    """
+
+    table = np.ones(7, dtype=np.bool_)
+
+    # values that can't be rolled never stop the strategy
+    for value in constant_parameters[0]:
+        if 1 <= value <= 6:
+            table[value] = False
+
+    return table
+
+
+# decision functions that can be replaced with a lookup table indexed by the turn sum or by the last roll
+TURN_TABLES = {
+    untilValue: untilValueTable
+}
+
+ROLL_TABLES = {
+    untilRoll: untilRollTable
+}
+
+# ----- decision factories -----
+
+
+def makeAgroAfter(constant_parameters):
+    """
+
+    builds agroAfter as a closure over its delta, called with (winning_score, current_score, opponent_score, turn_sum, last_roll).
+
+    """
 
+    delta = constant_parameters[0]
+
+    def decide(winning_score, current_score, opponent_score, turn_sum, last_roll) -> bool:
+        return (winning_score - current_score) <= delta or random.random() < 0.5
+
+    return decide
+
+
+def makeAgroAfterOpponent(constant_parameters):
+    """
+
+    builds agroAfterOpponent as a closure over its delta, called with (winning_score, current_score, opponent_score, turn_sum, last_roll).
+
+    """
+
+    delta = constant_parameters[0]
+
+    def decide(winning_score, current_score, opponent_score, turn_sum, last_roll) -> bool:
+        return (winning_score - opponent_score) <= delta or random.random() < 0.5
+
+    return decide
+
+
+# decision functions that strategies call through a closure built by a factory
+DECISION_FACTORIES = {
+    agroAfter: makeAgroAfter,
+    agroAfterOpponent: makeAgroAfterOpponent
+}
+
+# ----- turn functions -----
+
+
+"""
+
+turn functions play a whole turn for a decision function that never needs to be asked about a roll, and return the points banked.
+
+def functionNameTurn(winning_score, current_score, constant_parameters) -> int:
+
+    function-y stuff, blah blah blah ....
+
+"""
+
+
+def untilValueTurn(winning_score, current_score, constant_parameters) -> int:
+    """
+
+    plays an untilValue turn: rolls until a 1, or until the turn sum reaches the value (or the winning score).
+
+    """
+
+    target = min(constant_parameters[0], winning_score - current_score)
+
+    turn_sum = 0
+    while True:
+
+        roll = rollDie()
+        if roll == 1:
+            return 0
+
+        turn_sum += roll
+        if turn_sum >= target:
+            return turn_sum
+
+
+def untilRollTurn(winning_score, current_score, constant_parameters) -> int:
+    """
+
+    plays an untilRoll turn: rolls until a 1, a value in the set (which is banked), or the winning score.
+
+    """
+
+    stop_rolls = constant_parameters[0]
+    target = winning_score - current_score
+
+    turn_sum = 0
+    while True:
+
+        roll = rollDie()
+        if roll == 1:
+            return 0
+
+        turn_sum += roll
+        if roll in stop_rolls or turn_sum >= target:
+            return turn_sum
+
+
+def alwaysTrueTurn(winning_score, current_score, constant_parameters) -> int:
+    """
+
+    plays an alwaysTrue turn: rolls until a 1 or the winning score.
+
+    """
+
+    target = winning_score - current_score
+
+    turn_sum = 0
+    while True:
+
+        roll = rollDie()
+        if roll == 1:
+            return 0
+
+        turn_sum += roll
+        if turn_sum >= target:
+            return turn_sum
+
+
+def alwaysFalseTurn(winning_score, current_score, constant_parameters) -> int:
+    """
+
+    plays an alwaysFalse turn: a single roll.
+
+    """
+
+    roll = rollDie()
+    if roll == 1:
+        return 0
+
+    return roll
+
+
+# decision functions whose turns can be played by a turn function
+TURN_FUNCTIONS = {
+    untilValue: untilValueTurn,
+    untilRoll: untilRollTurn,
+    alwaysTrue: alwaysTrueTurn,
+    alwaysFalse: alwaysFalseTurn
+}
+
+# map from the built-in decision functions to their compiled kernel ids
+DECISION_IDS = {
+    randomDecision: RANDOM_DECISION,
+    untilValue: UNTIL_VALUE,
+    untilRoll: UNTIL_ROLL,
+    alwaysTrue: ALWAYS_TRUE,
+    alwaysFalse: ALWAYS_FALSE,
+    agroAfter: AGRO_AFTER,
+    agroAfterOpponent: AGRO_AFTER_OPPONENT,
+    beatOpponent: BEAT_OPPONENT
+}
 
 # ----- decision function, strategy definitions -----
 
@@ -827,6 +1544,8 @@ strategies = [
     beatOpponentStrategy
 ]
 
-print(len(strategies))
+if __name__ == "__main__":
+
+    print(len(strategies))
 
-results = testStrategies(strategies, 100, 10000)
+    results = testStrategies(strategies, 100, 10000)